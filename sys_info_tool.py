@@ -4,21 +4,545 @@ System Information Tool with GUI - Similar to Speccy
 Collects and displays detailed hardware information
 """
 
+import csv
+import ctypes
+import json
+import os
 import platform
 import psutil
+import queue
 from datetime import datetime
+import shutil
+import socket
 import subprocess
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import threading
+import time
+from types import SimpleNamespace
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
 
+# Platform facts that can't change while the program runs
+_UNAME = platform.uname()
+_IS_WIN = _UNAME.system == "Windows"
+_IS_LINUX = _UNAME.system == "Linux"
+_MACHINE = _UNAME.machine
+_PHYS_CORES = psutil.cpu_count(logical=False)
+_LOG_CORES = psutil.cpu_count(logical=True)
+
+# External tools, resolved once so missing ones are skipped without a PATH search
+_NVSMI = shutil.which('nvidia-smi')
+# PowerShell 7 starts noticeably faster than Windows PowerShell 5.1
+_PWSH = shutil.which('pwsh') or shutil.which('powershell')
+
+# Keep console windows from flashing up for each subprocess on Windows
+_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# WMI data gathered per key: (namespace, class, properties). Queries name
+# their columns so WMI only marshals the properties we display.
+_WMI_QUERIES = {
+    'cpu': ('root/cimv2', 'Win32_Processor', ('Name',)),
+    'gpu': ('root/cimv2', 'Win32_VideoController', ('Name', 'AdapterRAM')),
+    'ram': ('root/cimv2', 'Win32_PhysicalMemory',
+            ('Manufacturer', 'PartNumber', 'Capacity', 'Speed', 'DeviceLocator')),
+    'mobo': ('root/cimv2', 'Win32_BaseBoard', ('Manufacturer', 'Product', 'Version', 'SerialNumber')),
+    'bios': ('root/cimv2', 'Win32_BIOS', ('Manufacturer', 'Name', 'Version', 'ReleaseDate')),
+    'disks': ('root/cimv2', 'Win32_DiskDrive', ('Model', 'Size', 'InterfaceType')),
+    'thermal': ('root/wmi', 'MSAcpi_ThermalZoneTemperature', ('CurrentTemperature',)),
+}
+
+# The registry is only available on Windows
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+# pywin32 is optional - without it WMI goes through PowerShell
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    win32com = None
+
+# SWbemServices.ExecQuery flags: wbemFlagReturnImmediately | wbemFlagForwardOnly
+_WBEM_QUERY_FLAGS = 0x10 | 0x20
+
+# NVML bindings (nvidia-ml-py) are optional - without them we use nvidia-smi
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+# None: NVML library missing, fall back to nvidia-smi
+# False: NVML present but no usable NVIDIA driver
+# True: query GPUs through NVML
+_NVML = None
+if pynvml is not None:
+    try:
+        pynvml.nvmlInit()
+        _NVML = True
+    except pynvml.NVMLError_LibraryNotFound:
+        pass
+    except pynvml.NVMLError:
+        _NVML = False
+
+# Rules used in the report text
+_EQ = "=" * 50
+_DASH = "-" * 50
+_EQ_WIDE = "=" * 60
+
+# Shown on each tab until its section arrives
+_LOADING = "Loading..."
+
+def _section(title, rule=_EQ):
+    """Heading for a section within a tab, ruled above and below"""
+    return f"\n{rule}\n{title}\n{rule}\n\n"
+
+# Lines of a tab copied per chunk when exporting
+_EXPORT_CHUNK_LINES = 256
+
+_SIZE_UNITS = ("", "K", "M", "G", "T", "P")
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
+
+@lru_cache(maxsize=256)
 def get_size(bytes_val, suffix="B"):
     """Convert bytes to human-readable format"""
-    factor = 1024
-    for unit in ["", "K", "M", "G", "T", "P"]:
-        if bytes_val < factor:
-            return f"{bytes_val:.2f}{unit}{suffix}"
-        bytes_val /= factor
+    if bytes_val < 1024:
+        return f"{bytes_val:.2f}{suffix}"
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    idx = min(len(_SIZE_UNITS) - 1, (int(bytes_val).bit_length() - 1) // 10)
+    return f"{bytes_val / _SIZE_DIVISORS[idx]:.2f}{_SIZE_UNITS[idx]}{suffix}"
+
+def get_nvml_gpus():
+    """Query NVIDIA GPUs in-process through NVML
+    
+    Returns rows in nvidia-smi field order (name, driver, temperature,
+    memory total/used/free in MB, utilization), or None when NVML is
+    unavailable and nvidia-smi should be used instead.
+    """
+    if _NVML is None:
+        return None
+    if not _NVML:
+        return []
+    
+    def query(fn, *args):
+        try:
+            return fn(*args)
+        except pynvml.NVMLError:
+            return None
+    
+    rows = []
+    try:
+        driver = pynvml.nvmlSystemGetDriverVersion()
+        for i in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+            name = pynvml.nvmlDeviceGetName(handle)
+            memory = query(pynvml.nvmlDeviceGetMemoryInfo, handle)
+            util = query(pynvml.nvmlDeviceGetUtilizationRates, handle)
+            temp = query(pynvml.nvmlDeviceGetTemperature, handle, pynvml.NVML_TEMPERATURE_GPU)
+            
+            mb = 1024 * 1024
+            rows.append([
+                name.decode() if isinstance(name, bytes) else name,
+                driver.decode() if isinstance(driver, bytes) else driver,
+                str(temp) if temp is not None else "N/A",
+                str(memory.total // mb) if memory else "N/A",
+                str(memory.used // mb) if memory else "N/A",
+                str(memory.free // mb) if memory else "N/A",
+                str(util.gpu) if util else "N/A",
+            ])
+    except pynvml.NVMLError:
+        pass
+    return rows
+
+# Network file systems - stat'ing an unreachable share can hang for a minute
+_REMOTE_FSTYPES = {'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs'}
+
+def get_windows_partitions():
+    """Enumerate formatted fixed drives on Windows
+    
+    psutil.disk_partitions() queries volume information for every drive
+    letter, which can hang on disconnected network shares and empty
+    removable drives. Only fixed drives are asked for their file system.
+    """
+    DRIVE_FIXED = 3
+    FILE_READ_ONLY_VOLUME = 0x80000
+    
+    kernel32 = ctypes.windll.kernel32
+    buf = ctypes.create_unicode_buffer(512)
+    length = kernel32.GetLogicalDriveStringsW(len(buf), buf)
+    
+    partitions = []
+    for root in buf[:length].split('\0'):
+        if not root or kernel32.GetDriveTypeW(root) != DRIVE_FIXED:
+            continue
+        
+        fs_name = ctypes.create_unicode_buffer(64)
+        flags = ctypes.c_ulong()
+        # Fails for unformatted or locked (e.g. BitLocker) volumes
+        if not kernel32.GetVolumeInformationW(root, None, 0, None, None,
+                                              ctypes.byref(flags), fs_name, len(fs_name)):
+            continue
+        
+        opts = 'ro,fixed' if flags.value & FILE_READ_ONLY_VOLUME else 'rw,fixed'
+        partitions.append(SimpleNamespace(device=root, mountpoint=root,
+                                          fstype=fs_name.value, opts=opts))
+    return partitions
+
+# Mountpoints whose disk_usage call hasn't returned yet. Rescans skip them
+# instead of leaving another thread stuck on the same drive.
+_STAT_PENDING = set()
+
+def _stat_partition(mountpoint, future):
+    """Thread target resolving future with disk_usage(mountpoint)"""
+    try:
+        future.set_result(psutil.disk_usage(mountpoint))
+    except Exception as e:
+        future.set_exception(e)
+    finally:
+        _STAT_PENDING.discard(mountpoint)
+
+def get_partition_usages(partitions, timeout=2):
+    """Get disk usage for local partitions in parallel
+    
+    Network shares and drives without media are skipped. Returns
+    (partition, usage) pairs, with usage None if it couldn't be read
+    within the timeout. Each stat runs on a daemon thread, so a hung
+    drive can't keep the program from exiting.
+    """
+    local = [p for p in partitions
+             if p.fstype and p.fstype not in _REMOTE_FSTYPES
+             and 'remote' not in p.opts and 'cdrom' not in p.opts]
+    
+    futures = []
+    for partition in local:
+        future = Future()
+        if partition.mountpoint in _STAT_PENDING:
+            future.set_result(None)
+        else:
+            _STAT_PENDING.add(partition.mountpoint)
+            threading.Thread(target=_stat_partition, args=(partition.mountpoint, future),
+                             daemon=True).start()
+        futures.append((partition, future))
+    deadline = time.monotonic() + timeout
+    
+    usages = []
+    for partition, future in futures:
+        try:
+            usage = future.result(timeout=max(0, deadline - time.monotonic()))
+        except Exception:
+            usage = None
+        usages.append((partition, usage))
+    return usages
+
+class PendingCommand:
+    """A subprocess launched early whose output is collected on first use"""
+    
+    def __init__(self, args, timeout):
+        self._deadline = time.monotonic() + timeout
+        self._lock = threading.Lock()
+        self._done = False
+        self._output = None
+        try:
+            self._proc = subprocess.Popen(
+                args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, creationflags=_NO_WINDOW
+            )
+        except OSError:
+            self._proc = None
+    
+    def output(self):
+        """Wait for the command and return its stdout, or None if it failed"""
+        with self._lock:
+            if not self._done:
+                self._done = True
+                if self._proc:
+                    try:
+                        stdout, _ = self._proc.communicate(
+                            timeout=max(0, self._deadline - time.monotonic()))
+                        if self._proc.returncode == 0:
+                            self._output = stdout
+                    except subprocess.TimeoutExpired:
+                        self._proc.kill()
+                        self._proc.communicate()
+            return self._output
+
+class PendingResult:
+    """Work queued on a background executor, with the PendingCommand interface"""
+    
+    def __init__(self, future, timeout=None):
+        self._future = future
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+    
+    def output(self):
+        """Wait for the work and return its result, or None if it failed"""
+        try:
+            if self._deadline is None:
+                return self._future.result()
+            return self._future.result(timeout=max(0, self._deadline - time.monotonic()))
+        except Exception:
+            return None
+    
+    def expired(self):
+        """True if the work is still running after its timeout"""
+        return (self._deadline is not None and not self._future.done()
+                and time.monotonic() >= self._deadline)
+
+class PowerShellHost:
+    """One long-lived PowerShell process that runs scripts fed through stdin
+    
+    Each script is followed by a sentinel line so its output can be told
+    apart from the next one. The process exits on its own once our end of
+    the pipe closes.
+    """
+    
+    _SENTINEL = '<<<END-OF-SCRIPT>>>'
+    
+    def __init__(self, executable):
+        self._lines = queue.Queue()
+        self._lock = threading.Lock()
+        # Scripts run one at a time, in the order they were submitted
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            self._proc = subprocess.Popen(
+                [executable, '-NoProfile', '-NoLogo', '-NonInteractive', '-Command', '-'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, bufsize=1, creationflags=_NO_WINDOW
+            )
+        except OSError:
+            self._proc = None
+        else:
+            threading.Thread(target=self._pump, daemon=True).start()
+    
+    def _pump(self):
+        """Move stdout lines onto the queue so reads can time out"""
+        for line in self._proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+    
+    def alive(self):
+        """True while the PowerShell process is running"""
+        return self._proc is not None and self._proc.poll() is None
+    
+    def run(self, script, timeout):
+        """Run a single-line script and return its output, or None on failure"""
+        with self._lock:
+            if not self.alive():
+                return None
+            try:
+                self._proc.stdin.write(f"{script}\nWrite-Output '{self._SENTINEL}'\n")
+                self._proc.stdin.flush()
+            except OSError:
+                self._proc.kill()
+                return None
+            
+            deadline = time.monotonic() + timeout
+            lines = []
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    # A hung query would desync the sentinel, so give up on the host
+                    self._proc.kill()
+                    return None
+                if line is None:
+                    return None
+                if line.rstrip() == self._SENTINEL:
+                    return "".join(lines)
+                lines.append(line)
+    
+    def submit(self, script, timeout):
+        """Queue a script to run in the background"""
+        return PendingResult(self._executor.submit(self.run, script, timeout))
+
+class WmiComClient:
+    """In-process WMI queries through the SWbemLocator scripting API
+    
+    COM objects belong to the thread that created them, so every query
+    runs on one worker thread that initializes COM when it starts. The
+    worker is a daemon thread, so a query that never returns can't keep
+    the program from exiting.
+    """
+    
+    def __init__(self):
+        self._requests = queue.Queue()
+        self._locator = None
+        self._connections = {}
+        threading.Thread(target=self._work, daemon=True).start()
+    
+    def _work(self):
+        """Worker thread loop running queued queries"""
+        pythoncom.CoInitialize()
+        while True:
+            keys, future = self._requests.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self._query(keys))
+            except Exception as e:
+                future.set_exception(e)
+    
+    def _connect(self, namespace):
+        """Return the SWbemServices connection for a namespace, opening it once"""
+        if namespace not in self._connections:
+            if self._locator is None:
+                self._locator = win32com.client.Dispatch('WbemScripting.SWbemLocator')
+            self._connections[namespace] = self._locator.ConnectServer(
+                '.', namespace.replace('/', '\\'))
+        return self._connections[namespace]
+    
+    def _query(self, keys):
+        """Run the _WMI_QUERIES entries for keys and return {key: records}"""
+        results = {}
+        for key in keys:
+            namespace, wmi_class, props = _WMI_QUERIES[key]
+            try:
+                # A forward-only, semi-synchronous enumerator is read once and
+                # doesn't keep objects around for backwards navigation
+                rows = self._connect(namespace).ExecQuery(
+                    f"SELECT {', '.join(props)} FROM {wmi_class}", 'WQL', _WBEM_QUERY_FLAGS)
+                results[key] = [{prop: getattr(row, prop) for prop in props} for row in rows]
+            except Exception:
+                results[key] = None
+        return results
+    
+    def submit(self, keys, timeout):
+        """Queue queries for the given _WMI_QUERIES keys"""
+        future = Future()
+        self._requests.put((keys, future))
+        return PendingResult(future, timeout)
+
+def cim_query(key):
+    """PowerShell statements storing the WQL query for a _WMI_QUERIES key in $out
+    
+    A query that finds nothing stores an empty list; one that fails stores
+    null, so it can be told apart and retried.
+    """
+    namespace, wmi_class, props = _WMI_QUERIES[key]
+    columns = ', '.join(props)
+    return (f"$out.{key}=@(Get-CimInstance -Namespace {namespace} "
+            f"-Query 'SELECT {columns} FROM {wmi_class}' "
+            f"-ErrorAction SilentlyContinue -ErrorVariable err | Select-Object {columns}); "
+            f"if ($err) {{ $out.{key}=$null }}")
+
+def get_cache_path():
+    """Location of the on-disk cache of static hardware facts"""
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'sys_info_tool.json')
+
+# How long each cached reading stays fresh, in seconds. None keeps it for
+# the whole run; identity data (OS, board, BIOS) is cached elsewhere.
+_TTLS = {
+    'get_boot_time': None,
+    'get_battery': 5,
+    'get_temperatures': 2,
+    'get_net_io': 1,
+}
+
+def ttl_cache(func):
+    """Cache a function's result per argument tuple for its lifetime in _TTLS"""
+    ttl = _TTLS[func.__name__]
+    entries = {}
+    
+    @wraps(func)
+    def wrapper(*args):
+        now = time.monotonic()
+        entry = entries.get(args)
+        if entry and (ttl is None or now - entry[0] < ttl):
+            return entry[1]
+        value = func(*args)
+        entries[args] = (now, value)
+        return value
+    return wrapper
+
+# hwmon drivers worth showing; anything else (1-Wire buses in particular)
+# can take up to a second per sensor to read
+_HWMON_DRIVERS = {'coretemp', 'k10temp', 'nvme', 'amdgpu', 'thinkpad', 'cpu_thermal'}
+
+def read_sysfs(path, default=None):
+    """Return the stripped contents of a sysfs file, or default if unreadable"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return default
+
+def read_millidegrees(path):
+    """Read a hwmon temperature file as degrees Celsius, or None"""
+    try:
+        return int(read_sysfs(path)) / 1000
+    except (TypeError, ValueError):
+        return None
+
+def read_hwmon_temperatures(hwmon_dir='/sys/class/hwmon'):
+    """Read allowlisted hwmon sensors directly, in psutil's sensors_temperatures shape"""
+    temps = {}
+    with os.scandir(hwmon_dir) as hwmons:
+        hwmon_paths = [hwmon.path for hwmon in hwmons]
+    for hwmon_path in hwmon_paths:
+        name = read_sysfs(os.path.join(hwmon_path, 'name'))
+        if name not in _HWMON_DRIVERS:
+            continue
+        
+        # Sort temp2_input before temp10_input
+        with os.scandir(hwmon_path) as entries:
+            inputs = sorted((e.name for e in entries
+                             if e.name.startswith('temp') and e.name.endswith('_input')),
+                            key=lambda n: (len(n), n))
+        for input_name in inputs:
+            base = os.path.join(hwmon_path, input_name[:-len('_input')])
+            current = read_millidegrees(base + '_input')
+            if current is None:
+                continue
+            temps.setdefault(name, []).append(SimpleNamespace(
+                label=read_sysfs(base + '_label', ''),
+                current=current,
+                high=read_millidegrees(base + '_max'),
+                critical=read_millidegrees(base + '_crit'),
+            ))
+    return temps
+
+@ttl_cache
+def get_temperatures():
+    """Temperature sensors, in psutil's sensors_temperatures shape"""
+    if _IS_LINUX:
+        return read_hwmon_temperatures()
+    return psutil.sensors_temperatures()
+
+@ttl_cache
+def get_battery():
+    """psutil battery status"""
+    return psutil.sensors_battery()
+
+@ttl_cache
+def get_net_io():
+    """System-wide network counters"""
+    return psutil.net_io_counters()
+
+@ttl_cache
+def get_boot_time():
+    """System boot time as a Unix timestamp"""
+    return psutil.boot_time()
+
+@lru_cache(maxsize=None)
+def get_os_details():
+    """Format the uname fields, which cannot change while the program runs"""
+    return (f"System: {_UNAME.system}\n"
+            f"Node Name: {_UNAME.node}\n"
+            f"Release: {_UNAME.release}\n"
+            f"Version: {_UNAME.version}\n"
+            f"Machine: {_UNAME.machine}\n"
+            f"Processor: {_UNAME.processor}\n\n")
+
+@lru_cache(maxsize=None)
+def get_dmi_board(dmi_dir='/sys/devices/virtual/dmi/id'):
+    """Read the Linux DMI board_* files in one directory pass, as {name: value}"""
+    try:
+        return {entry.name: read_sysfs(entry.path, '') for entry in os.scandir(dmi_dir)
+                if entry.name.startswith('board_')}
+    except OSError:
+        return {}
 
 class SystemInfoGUI:
     def __init__(self, root):
@@ -29,6 +553,31 @@ class SystemInfoGUI:
         # Initialize text_widgets dictionary FIRST
         self.text_widgets = {}
         
+        # External commands launched at the start of each scan
+        self._wmi_command = None
+        self._nvsmi_command = None
+        self._wmi_thermal = None
+        self._wmi_lock = threading.Lock()
+        self._wmi_read = False
+        # None until the thermal query answers; False once it answered with
+        # no ACPI thermal zones, so later scans stop asking
+        self._win_thermal_ok = None
+        
+        # Query WMI in-process when pywin32 is installed; otherwise warm
+        # PowerShell up now so the first scan doesn't pay its startup cost
+        self._wmi_client = WmiComClient() if _IS_WIN and win32com else None
+        self._ps_host = None
+        if _IS_WIN and _PWSH and not self._wmi_client:
+            self._ps_host = PowerShellHost(_PWSH)
+        
+        # Hardware facts that don't change until reboot, persisted to disk
+        self._static_cache = {}
+        self._load_static_cache()
+        
+        # Prime psutil's CPU usage counters so scans can sample without blocking
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(percpu=True, interval=None)
+        
         # Create main frame
         main_frame = ttk.Frame(root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -83,8 +632,14 @@ class SystemInfoGUI:
         frame = ttk.Frame(self.notebook)
         self.notebook.add(frame, text=name)
         
-        text_widget = scrolledtext.ScrolledText(frame, wrap=tk.WORD, 
+        # The reports are fixed-format, so scroll long lines instead of
+        # re-wrapping them on every insert
+        text_widget = scrolledtext.ScrolledText(frame, wrap=tk.NONE, 
                                                font=("Courier", 10))
+        x_scrollbar = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, 
+                                    command=text_widget.xview)
+        text_widget.configure(xscrollcommand=x_scrollbar.set)
+        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X, padx=5)
         text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         self.text_widgets[name] = text_widget
@@ -94,19 +649,23 @@ class SystemInfoGUI:
         if tab_name in self.text_widgets:
             widget = self.text_widgets[tab_name]
             widget.config(state=tk.NORMAL)
+            widget.mark_set(tk.INSERT, 1.0)
             widget.delete(1.0, tk.END)
-            widget.insert(1.0, content)
+            widget.insert(tk.END, content)
             widget.config(state=tk.DISABLED)
     
     def start_scan(self):
         """Start system scan in a separate thread"""
         self.scan_button.config(state=tk.DISABLED)
+        # Don't let an export pick up the placeholders
+        self.export_button.config(state=tk.DISABLED)
         self.status_label.config(text="Scanning system...", foreground="orange")
         
-        # Clear all tabs
+        # Show a placeholder until each tab's section arrives
         for widget in self.text_widgets.values():
             widget.config(state=tk.NORMAL)
             widget.delete(1.0, tk.END)
+            widget.insert(tk.END, _LOADING)
             widget.config(state=tk.DISABLED)
         
         # Run scan in thread to prevent GUI freezing
@@ -116,803 +675,895 @@ class SystemInfoGUI:
     def scan_system(self):
         """Perform system scan"""
         try:
-            # Get all information
-            os_info = self.get_os_info()
-            cpu_info = self.get_cpu_info()
-            memory_info = self.get_memory_info()
-            gpu_info = self.get_gpu_info()
-            storage_info = self.get_disk_info()
-            motherboard_info = self.get_motherboard_info()
-            network_info = self.get_network_info()
-            
-            # Get component names for summary
-            components_summary = self.get_components_summary()
-            
-            # Create summary
-            summary = f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            summary += f"System: {platform.system()} {platform.release()}\n"
-            summary += f"Processor: {platform.processor()}\n"
-            summary += f"CPU Cores: {psutil.cpu_count(logical=False)} Physical, {psutil.cpu_count(logical=True)} Logical\n"
-            
-            svmem = psutil.virtual_memory()
-            summary += f"Total RAM: {get_size(svmem.total)}\n"
-            
-            partitions = psutil.disk_partitions()
-            summary += f"Storage Devices: {len(partitions)}\n"
-            
-            summary += "\n" + "="*50 + "\n"
-            summary += "Click other tabs for detailed information"
+            # Launch the external queries first so they run alongside the getters
+            self._start_commands()
             
-            # Update tabs
-            self.root.after(0, self.update_tab, "Summary", summary)
-            self.root.after(0, self.update_tab, "All Components", components_summary)
-            self.root.after(0, self.update_tab, "CPU", cpu_info)
-            self.root.after(0, self.update_tab, "Memory", memory_info)
-            self.root.after(0, self.update_tab, "GPU", gpu_info)
-            self.root.after(0, self.update_tab, "Storage", storage_info)
-            self.root.after(0, self.update_tab, "Motherboard", motherboard_info)
-            self.root.after(0, self.update_tab, "Network", network_info)
-            self.root.after(0, self.update_tab, "OS", os_info)
+            # Get all information - the sections are independent and mostly
+            # wait on subprocesses, so run them concurrently
+            tasks = {
+                "Summary": self.get_scan_summary,
+                "All Components": self.get_components_summary,
+                "CPU": self.get_cpu_info,
+                "Memory": self.get_memory_info,
+                "GPU": self.get_gpu_info,
+                "Storage": self.get_disk_info,
+                "Motherboard": self.get_motherboard_info,
+                "Network": self.get_network_info,
+                "OS": self.get_os_info,
+            }
+            # One extra worker for the partition stats the snapshot starts
+            with ThreadPoolExecutor(max_workers=len(tasks) + 1) as pool:
+                # Read the psutil counters once and share them between the tabs
+                snap = self._take_snapshot(pool)
+                futures = {pool.submit(fn, snap): name for name, fn in tasks.items()}
+                
+                # Update each tab as soon as its section is ready
+                pending = list(tasks)
+                for future in as_completed(futures):
+                    name = futures[future]
+                    self.root.after(0, self.update_tab, name, future.result())
+                    
+                    pending.remove(name)
+                    if pending:
+                        status = f"Scanning... {name} done, waiting for {', '.join(pending)}"
+                        self.root.after(0, self.status_label.config, 
+                                      {"text": status, "foreground": "orange"})
             
             self.root.after(0, self.scan_complete)
             
         except Exception as e:
             error_msg = f"Error during scan: {str(e)}"
-            self.root.after(0, self.status_label.config, 
-                          {"text": error_msg, "foreground": "red"})
-            self.root.after(0, self.scan_button.config, {"state": tk.NORMAL})
+            self.root.after(0, self.scan_failed, error_msg)
     
     def scan_complete(self):
         """Called when scan is complete"""
         self.status_label.config(text="Scan complete!", foreground="green")
         self.scan_button.config(state=tk.NORMAL)
+        self.export_button.config(state=tk.NORMAL)
+        self._save_static_cache()
     
-    def get_components_summary(self):
-        """Get a clean summary of all component names"""
-        info = "ALL COMPONENTS - QUICK OVERVIEW\n"
-        info += "="*60 + "\n\n"
-        
-        # CPU
-        info += "┌─ PROCESSOR\n"
-        info += "│\n"
-        cpu_name = "Unknown"
-        if platform.system() == "Windows":
+    def scan_failed(self, error_msg):
+        """Called when a scan stops on an error"""
+        self.status_label.config(text=error_msg, foreground="red")
+        # Tabs that never got their section would otherwise say Loading... until the next scan
+        for tab_name, widget in self.text_widgets.items():
+            if widget.get(1.0, "end-1c") == _LOADING:
+                self.update_tab(tab_name, error_msg)
+        self.scan_button.config(state=tk.NORMAL)
+        self.export_button.config(state=tk.NORMAL)
+    
+    def _load_static_cache(self):
+        """Load cached hardware facts if they belong to this machine and boot"""
+        try:
+            with open(get_cache_path(), encoding='utf-8') as f:
+                data = json.load(f)
+            
+            # Hardware may have changed across a reboot, so only trust the
+            # cache for the boot it was written in
+            if (data.get('node') == _UNAME.node
+                    and abs(data.get('boot_time', 0) - get_boot_time()) < 2):
+                self._static_cache = data.get('facts', {})
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+    
+    def _save_static_cache(self):
+        """Persist cached hardware facts for later scans and runs"""
+        try:
+            path = get_cache_path()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'node': _UNAME.node,
+                    'boot_time': get_boot_time(),
+                    'facts': self._static_cache,
+                }, f)
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    def _get_static(self, key, fetch):
+        """Return a cached hardware fact, calling fetch() on a cache miss"""
+        if key in self._static_cache:
+            return self._static_cache[key]
+        
+        value = fetch()
+        # Don't cache failed lookups, so the next scan retries them
+        if value:
+            self._static_cache[key] = value
+        return value
+    
+    def _take_snapshot(self, pool):
+        """Read the psutil counters used by the tabs in one go
+        
+        Partition usage is shown on several tabs, so each drive is statted
+        once. A slow drive can take seconds, so that runs on the pool and
+        usages is a future only the tabs that need it wait on.
+        """
+        return SimpleNamespace(
+            vmem=psutil.virtual_memory(),
+            swap=psutil.swap_memory(),
+            cpu_freq=psutil.cpu_freq(),
+            usages=pool.submit(self._get_partition_usages),
+            disk_io=psutil.disk_io_counters(),
+            net_if_addrs=psutil.net_if_addrs(),
+            net_io=get_net_io(),
+            boot_time=get_boot_time(),
+        )
+    
+    def _get_partition_usages(self):
+        """Get (partition, usage) pairs for the local drives"""
+        partitions = None
+        if _IS_WIN:
+            try:
+                partitions = get_windows_partitions()
+            except Exception:
+                pass
+        if partitions is None:
+            partitions = psutil.disk_partitions()
+        return get_partition_usages(partitions)
+    
+    def _start_commands(self):
+        """Start this scan's subprocesses without waiting for them"""
+        self._wmi_command = None
+        self._nvsmi_command = None
+        self._wmi_thermal = None
+        self._wmi_read = False
+        
+        if _IS_WIN and (self._wmi_client or _PWSH):
+            # One batch for every WMI query that isn't cached yet, including
+            # ones that failed last time. Temperatures are never cached.
+            cached = self._static_cache.get('wmi', {})
+            keys = [key for key in _WMI_QUERIES
+                    if key not in cached
+                    and (key != 'thermal' or self._win_thermal_ok is not False)]
+            if keys:
+                self._wmi_command = self._query_wmi(keys, timeout=4 if keys == ['thermal'] else 8)
+        
+        # nvidia-smi is only needed when NVML can't be loaded in-process
+        if _NVML is None and _NVSMI:
+            self._nvsmi_command = PendingCommand(
+                [_NVSMI, '--query-gpu=name,driver_version,temperature.gpu,memory.total,memory.used,memory.free,utilization.gpu',
+                 '--format=csv,noheader,nounits'],
+                timeout=2
+            )
+    
+    def _query_wmi(self, keys, timeout):
+        """Start the _WMI_QUERIES entries for keys over COM, or else PowerShell"""
+        if self._wmi_client:
+            return self._wmi_client.submit(keys, timeout)
+        return self._run_powershell(self._wmi_script(keys), timeout)
+    
+    def _run_powershell(self, script, timeout):
+        """Run a script on the shared PowerShell host, or in its own process if the host died"""
+        if self._ps_host and self._ps_host.alive():
+            return self._ps_host.submit(script, timeout)
+        return PendingCommand(
+            [_PWSH, '-NoProfile', '-NonInteractive', '-Command', script],
+            timeout=timeout
+        )
+    
+    def _wmi_script(self, keys):
+        """PowerShell script that emits the WMI data for keys as one JSON object"""
+        queries = ''.join(f"{cim_query(key)}; " for key in keys)
+        return f"$out=@{{}}; {queries}$out | ConvertTo-Json -Depth 4"
+    
+    def _read_wmi_result(self, pending):
+        """Wait for a _query_wmi batch and return its data as a dict"""
+        output = pending.output() if pending else None
+        # PowerShell hands back JSON text, the COM client a dict
+        if isinstance(output, str):
+            try:
+                output = json.loads(output)
+            except ValueError:
+                pass
+        return output if isinstance(output, dict) else {}
+    
+    def _wmi_data(self):
+        """Return the cached WMI records, merged with this scan's batch once it arrives"""
+        with self._wmi_lock:
+            if self._wmi_command and not self._wmi_read:
+                self._wmi_read = True
+                data = self._read_wmi_result(self._wmi_command)
+                if self._wmi_client and self._wmi_command.expired():
+                    # A hung COM query would stall every later batch behind it
+                    # on the worker thread. PowerShell kills its process on
+                    # timeout, so use that from now on.
+                    self._wmi_client = None
+                    if _PWSH:
+                        self._ps_host = PowerShellHost(_PWSH)
+                # Temperatures change, so keep them out of the static cache
+                self._wmi_thermal = data.get('thermal')
+                # Most consumer boards expose no thermal zones. Only give up on
+                # them when the query itself answered, not when the batch timed
+                # out or failed.
+                if 'thermal' in data and not self._wmi_thermal:
+                    self._win_thermal_ok = False
+                # Failed queries come back as None; leave them out so they're retried
+                fresh = {key: value for key, value in data.items()
+                         if key != 'thermal' and value is not None}
+                if fresh:
+                    self._static_cache['wmi'] = {**self._static_cache.get('wmi', {}), **fresh}
+            return self._static_cache.get('wmi', {})
+    
+    def _get_thermal_records(self):
+        """Return this scan's ACPI thermal zone readings as a list"""
+        # Reading the batched WMI output also picks up the temperatures
+        self._wmi_data()
+        data = self._wmi_thermal
+        
+        if isinstance(data, dict):
+            return [data]
+        return data or []
+    
+    def _get_nvidia_gpus(self):
+        """Get NVIDIA GPU rows from NVML, or from this scan's nvidia-smi run"""
+        rows = get_nvml_gpus()
+        if rows is None:
+            rows = []
+            output = self._nvsmi_command.output() if self._nvsmi_command else None
+            if output:
+                # csv handles quoted fields, e.g. a GPU name containing a comma
+                rows = [[field.strip() for field in row]
+                        for row in csv.reader(output.splitlines(), skipinitialspace=True)
+                        if row]
+        return rows
+    
+    def _wmi_records(self, key):
+        """Return WMI records for key as a list, or None if the query did not run or failed"""
+        data = self._wmi_data().get(key)
+        if data is None:
+            return None
+        # ConvertTo-Json emits a single object instead of a one-element list
+        if isinstance(data, dict):
+            return [data]
+        return data
+    
+    def _read_registry(self, path, names):
+        """Read the given values from an HKLM registry key, skipping missing ones"""
+        values = {}
+        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path)
+        try:
+            for name in names:
+                try:
+                    values[name] = winreg.QueryValueEx(key, name)[0]
+                except OSError:
+                    pass
+        finally:
+            winreg.CloseKey(key)
+        return values
+    
+    def _get_cpu_name(self):
+        """Get the CPU model name, cached across scans once a lookup succeeds"""
+        # Method 3: Fallback to platform, which isn't cached so lookups are retried
+        return self._get_static('cpu_name', self._read_cpu_name) or _UNAME.processor
+    
+    def _read_cpu_name(self):
+        """Look up the CPU model name - try multiple methods on Windows"""
+        if _IS_WIN:
+            # Method 1: Try registry (most reliable)
             try:
-                import winreg
                 key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
                                     r"HARDWARE\DESCRIPTION\System\CentralProcessor\0")
                 cpu_name = winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
                 winreg.CloseKey(key)
-            except:
-                cpu_name = platform.processor()
-        else:
-            cpu_name = platform.processor()
+                return cpu_name
+            except OSError:
+                # Method 2: Win32_Processor from the prefetched WMI data
+                cpu_data = self._wmi_records('cpu')
+                if cpu_data and cpu_data[0].get('Name'):
+                    return cpu_data[0]['Name'].strip()
+        return None
+    
+    def _get_board_data(self):
+        """Get motherboard identity, cached across scans once WMI has answered"""
+        if 'mobo' in self._static_cache:
+            return self._static_cache['mobo']
+        
+        board = self._read_board_data()
+        # The serial number only comes from WMI, so don't freeze a registry-only read
+        if self._wmi_records('mobo') is not None and any(board.values()):
+            self._static_cache['mobo'] = board
+        return board
+    
+    def _read_board_data(self):
+        """Read motherboard identity from the registry, filling gaps from WMI"""
+        board = {}
+        try:
+            values = self._read_registry(
+                r"HARDWARE\DESCRIPTION\System\BIOS",
+                ["BaseBoardManufacturer", "BaseBoardProduct", "BaseBoardVersion"]
+            )
+            board = {
+                'Manufacturer': values.get('BaseBoardManufacturer'),
+                'Product': values.get('BaseBoardProduct'),
+                'Version': values.get('BaseBoardVersion'),
+            }
+        except OSError:
+            pass
+        
+        # The serial number is only exposed through WMI
+        for key, value in ((self._wmi_records('mobo') or [{}])[0]).items():
+            if not board.get(key):
+                board[key] = value
+        return board
+    
+    def _read_gpu_records(self):
+        """List GPUs from WMI, taking driver and memory details from the registry
+        
+        Win32_VideoController only lists adapters that are present, but its
+        AdapterRAM is capped at 4 GB. The display class key has the full
+        size, yet keeps entries for removed or disabled adapters, so it is
+        only used to fill in details of adapters WMI reports. Drivers can be
+        updated without a reboot, so the registry is read again every scan
+        rather than cached with the adapter list.
+        """
+        adapters = self._wmi_records('gpu')
+        if not adapters:
+            return adapters
+        
+        details = self._read_gpu_registry()
+        gpus = []
+        for adapter in adapters:
+            gpu = dict(adapter)
+            values = details.get((adapter.get('Name') or '').strip(), {})
+            if values.get('DriverVersion'):
+                gpu['DriverVersion'] = values['DriverVersion']
+            if values.get('AdapterRAM'):
+                gpu['AdapterRAM'] = values['AdapterRAM']
+            gpus.append(gpu)
+        return gpus
+    
+    def _read_gpu_registry(self):
+        """Read driver version and memory size per adapter name from the display class key"""
+        details = {}
+        try:
+            class_path = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, class_path)
+            try:
+                subkeys = []
+                while True:
+                    try:
+                        subkeys.append(winreg.EnumKey(key, len(subkeys)))
+                    except OSError:
+                        break
+            finally:
+                winreg.CloseKey(key)
+            
+            for subkey in subkeys:
+                # Adapters live under 0000, 0001, ...; skip "Properties" and friends
+                if not subkey.isdigit():
+                    continue
+                try:
+                    values = self._read_registry(
+                        class_path + "\\" + subkey,
+                        ["DriverDesc", "DriverVersion",
+                         "HardwareInformation.qwMemorySize", "HardwareInformation.MemorySize"]
+                    )
+                except OSError:
+                    continue
+                
+                if not values.get('DriverDesc'):
+                    continue
+                
+                memory = values.get('HardwareInformation.qwMemorySize',
+                                    values.get('HardwareInformation.MemorySize'))
+                if isinstance(memory, bytes):
+                    memory = int.from_bytes(memory, 'little')
+                details[values['DriverDesc'].strip()] = {
+                    'DriverVersion': values.get('DriverVersion'),
+                    'AdapterRAM': memory,
+                }
+        except OSError:
+            pass
+        return details
+    
+    def get_scan_summary(self, snap):
+        """Get the overview shown on the Summary tab"""
+        parts = [f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"]
+        parts.append(f"System: {_UNAME.system} {_UNAME.release}\n")
+        parts.append(f"Processor: {_UNAME.processor}\n")
+        parts.append(f"CPU Cores: {_PHYS_CORES} Physical, {_LOG_CORES} Logical\n")
+        
+        parts.append(f"Total RAM: {get_size(snap.vmem.total)}\n")
+        parts.append(f"Storage Devices: {len(snap.usages.result())}\n")
+        
+        parts.append(f"\n{_EQ}\n")
+        parts.append("Click other tabs for detailed information")
+        return "".join(parts)
+    
+    def get_components_summary(self, snap):
+        """Get a clean summary of all component names"""
+        parts = [f"ALL COMPONENTS - QUICK OVERVIEW\n{_EQ_WIDE}\n\n"]
+        
+        # CPU
+        parts.append("┌─ PROCESSOR\n")
+        parts.append("│\n")
+        cpu_name = self._get_cpu_name() or "Unknown"
         
-        info += f"└─ {cpu_name}\n"
-        info += f"   • Cores: {psutil.cpu_count(logical=False)} Physical / {psutil.cpu_count(logical=True)} Logical\n"
-        cpu_freq = psutil.cpu_freq()
+        parts.append(f"└─ {cpu_name}\n")
+        parts.append(f"   • Cores: {_PHYS_CORES} Physical / {_LOG_CORES} Logical\n")
+        cpu_freq = snap.cpu_freq
         if cpu_freq:
-            info += f"   • Frequency: {cpu_freq.max:.0f} MHz\n"
-        info += "\n"
+            parts.append(f"   • Frequency: {cpu_freq.max:.0f} MHz\n")
+        parts.append("\n")
         
         # GPU
-        info += "┌─ GRAPHICS CARD(S)\n"
-        info += "│\n"
+        parts.append("┌─ GRAPHICS CARD(S)\n")
+        parts.append("│\n")
         
         gpu_found = False
         
-        # Try nvidia-smi
-        try:
-            result = subprocess.run(
-                ['nvidia-smi', '--query-gpu=name', '--format=csv,noheader'],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                for line in result.stdout.strip().split('\n'):
-                    info += f"└─ {line.strip()}\n"
-                    gpu_found = True
-        except:
-            pass
+        # NVIDIA GPUs via NVML or nvidia-smi
+        for gpu in self._get_nvidia_gpus():
+            parts.append(f"└─ {gpu[0]}\n")
+            gpu_found = True
         
         # Windows GPU
-        if platform.system() == "Windows":
+        if _IS_WIN:
             try:
-                ps_command = 'Get-CimInstance Win32_VideoController | Select-Object Name | ConvertTo-Json'
-                result = subprocess.run(
-                    ['powershell', '-Command', ps_command],
-                    capture_output=True, text=True, timeout=10
-                )
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    import json
-                    try:
-                        gpu_data = json.loads(result.stdout)
-                        if isinstance(gpu_data, dict):
-                            gpu_data = [gpu_data]
-                        
-                        for gpu in gpu_data:
-                            name = gpu.get('Name', '').strip()
-                            if name:
-                                info += f"└─ {name}\n"
-                                gpu_found = True
-                    except:
-                        pass
-            except:
+                for gpu in self._wmi_records('gpu') or []:
+                    name = (gpu.get('Name') or '').strip()
+                    if name:
+                        parts.append(f"└─ {name}\n")
+                        gpu_found = True
+            except Exception:
                 pass
         
         if not gpu_found:
-            info += "└─ No GPU detected\n"
+            parts.append("└─ No GPU detected\n")
         
-        info += "\n"
+        parts.append("\n")
         
         # RAM
-        info += "┌─ MEMORY (RAM)\n"
-        info += "│\n"
-        svmem = psutil.virtual_memory()
-        info += f"└─ Total: {get_size(svmem.total)}\n"
+        parts.append("┌─ MEMORY (RAM)\n")
+        parts.append("│\n")
+        parts.append(f"└─ Total: {get_size(snap.vmem.total)}\n")
         
-        if platform.system() == "Windows":
+        if _IS_WIN:
             try:
-                ps_command = 'Get-CimInstance Win32_PhysicalMemory | Select-Object Manufacturer, PartNumber, Capacity, Speed | ConvertTo-Json'
-                result = subprocess.run(
-                    ['powershell', '-Command', ps_command],
-                    capture_output=True, text=True, timeout=10
-                )
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    import json
-                    try:
-                        ram_data = json.loads(result.stdout)
-                        if isinstance(ram_data, dict):
-                            ram_data = [ram_data]
-                        
-                        for i, module in enumerate(ram_data, 1):
-                            manufacturer = module.get('Manufacturer', '').strip()
-                            part_number = module.get('PartNumber', '').strip()
-                            capacity = module.get('Capacity')
-                            speed = module.get('Speed')
-                            
-                            if capacity:
-                                module_str = f"   • Module {i}: {get_size(int(capacity))}"
-                                if speed:
-                                    module_str += f" @ {speed}MHz"
-                                if manufacturer and manufacturer != 'Unknown':
-                                    module_str += f" ({manufacturer}"
-                                    if part_number:
-                                        module_str += f" {part_number}"
-                                    module_str += ")"
-                                info += module_str + "\n"
-                    except:
-                        pass
-            except:
+                for i, module in enumerate(self._wmi_records('ram') or [], 1):
+                    manufacturer = (module.get('Manufacturer') or '').strip()
+                    part_number = (module.get('PartNumber') or '').strip()
+                    capacity = module.get('Capacity')
+                    speed = module.get('Speed')
+                    
+                    if capacity:
+                        module_str = f"   • Module {i}: {get_size(int(capacity))}"
+                        if speed:
+                            module_str += f" @ {speed}MHz"
+                        if manufacturer and manufacturer != 'Unknown':
+                            module_str += f" ({manufacturer}"
+                            if part_number:
+                                module_str += f" {part_number}"
+                            module_str += ")"
+                        parts.append(module_str + "\n")
+            except Exception:
                 pass
         
-        info += "\n"
+        parts.append("\n")
         
         # Motherboard
-        info += "┌─ MOTHERBOARD\n"
-        info += "│\n"
+        parts.append("┌─ MOTHERBOARD\n")
+        parts.append("│\n")
         
-        if platform.system() == "Windows":
+        if _IS_WIN:
             try:
-                ps_command = 'Get-CimInstance Win32_BaseBoard | Select-Object Manufacturer, Product | ConvertTo-Json'
-                result = subprocess.run(
-                    ['powershell', '-Command', ps_command],
-                    capture_output=True, text=True, timeout=10
-                )
+                mobo_data = self._get_board_data()
+                manufacturer = (mobo_data.get('Manufacturer') or '').strip()
+                product = (mobo_data.get('Product') or '').strip()
                 
-                if result.returncode == 0 and result.stdout.strip():
-                    import json
-                    try:
-                        mobo_data = json.loads(result.stdout)
-                        manufacturer = mobo_data.get('Manufacturer', '').strip()
-                        product = mobo_data.get('Product', '').strip()
-                        
-                        if manufacturer or product:
-                            mobo_name = f"{manufacturer} {product}".strip()
-                            info += f"└─ {mobo_name}\n"
-                        else:
-                            info += "└─ Unknown motherboard\n"
-                    except:
-                        info += "└─ Unknown motherboard\n"
+                if manufacturer or product:
+                    mobo_name = f"{manufacturer} {product}".strip()
+                    parts.append(f"└─ {mobo_name}\n")
                 else:
-                    info += "└─ Unknown motherboard\n"
-            except:
-                info += "└─ Unknown motherboard\n"
+                    parts.append("└─ Unknown motherboard\n")
+            except Exception:
+                parts.append("└─ Unknown motherboard\n")
         else:
-            info += "└─ Motherboard info not available\n"
+            parts.append("└─ Motherboard info not available\n")
         
-        info += "\n"
+        parts.append("\n")
         
         # Storage
-        info += "┌─ STORAGE DEVICES\n"
-        info += "│\n"
-        
-        if platform.system() == "Windows":
-            try:
-                ps_command = 'Get-CimInstance Win32_DiskDrive | Select-Object Model, Size | ConvertTo-Json'
-                result = subprocess.run(
-                    ['powershell', '-Command', ps_command],
-                    capture_output=True, text=True, timeout=10
-                )
-                
-                if result.returncode == 0 and result.stdout.strip():
-                    import json
-                    try:
-                        disk_data = json.loads(result.stdout)
-                        if isinstance(disk_data, dict):
-                            disk_data = [disk_data]
-                        
-                        for disk in disk_data:
-                            model = disk.get('Model', '').strip()
-                            size = disk.get('Size')
-                            
-                            if model:
-                                disk_str = f"└─ {model}"
-                                if size:
-                                    disk_str += f" ({get_size(int(size))})"
-                                info += disk_str + "\n"
-                    except:
-                        pass
-            except:
-                pass
+        parts.append("┌─ STORAGE DEVICES\n")
+        parts.append("│\n")
         
-        partitions = psutil.disk_partitions()
-        total_storage = 0
-        for partition in partitions:
+        if _IS_WIN:
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                total_storage += usage.total
-            except:
+                for disk in self._wmi_records('disks') or []:
+                    model = (disk.get('Model') or '').strip()
+                    size = disk.get('Size')
+                    
+                    if model:
+                        disk_str = f"└─ {model}"
+                        if size:
+                            disk_str += f" ({get_size(int(size))})"
+                        parts.append(disk_str + "\n")
+            except Exception:
                 pass
         
+        total_storage = sum(usage.total for _, usage in snap.usages.result() if usage)
         if total_storage > 0:
-            info += f"   • Total Storage: {get_size(total_storage)}\n"
+            parts.append(f"   • Total Storage: {get_size(total_storage)}\n")
         
-        info += "\n"
+        parts.append("\n")
         
         # OS
-        info += "┌─ OPERATING SYSTEM\n"
-        info += "│\n"
-        uname = platform.uname()
-        info += f"└─ {uname.system} {uname.release}\n"
-        info += f"   • Version: {uname.version}\n"
+        parts.append("┌─ OPERATING SYSTEM\n")
+        parts.append("│\n")
+        uname = _UNAME
+        parts.append(f"└─ {uname.system} {uname.release}\n")
+        parts.append(f"   • Version: {uname.version}\n")
         
-        info += "\n" + "="*60 + "\n"
-        info += "\n💡 Click other tabs for detailed specifications"
+        parts.append(f"\n{_EQ_WIDE}\n")
+        parts.append("\n💡 Click other tabs for detailed specifications")
         
-        return info
+        return "".join(parts)
     
-    def get_cpu_info(self):
+    def get_cpu_info(self, snap):
         """Get CPU information"""
-        info = "CPU INFORMATION\n"
-        info += "="*50 + "\n\n"
+        parts = [f"CPU INFORMATION\n{_EQ}\n\n"]
         
         # Get detailed CPU name on Windows - try multiple methods
-        cpu_name = "Unknown CPU"
-        
-        if platform.system() == "Windows":
-            # Method 1: Try registry (most reliable)
-            try:
-                import winreg
-                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                    r"HARDWARE\DESCRIPTION\System\CentralProcessor\0")
-                cpu_name = winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
-                winreg.CloseKey(key)
-            except:
-                # Method 2: Try WMIC
-                try:
-                    result = subprocess.run(
-                        ['wmic', 'cpu', 'get', 'name'],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if result.returncode == 0:
-                        lines = result.stdout.strip().split('\n')
-                        if len(lines) > 1:
-                            cpu_name = lines[1].strip()
-                except:
-                    # Method 3: Fallback to platform
-                    cpu_name = platform.processor()
-        else:
-            cpu_name = platform.processor()
+        cpu_name = self._get_cpu_name() or "Unknown CPU"
         
-        info += f"Processor: {cpu_name}\n"
-        info += f"Architecture: {platform.machine()}\n"
-        info += f"Physical Cores: {psutil.cpu_count(logical=False)}\n"
-        info += f"Total Cores: {psutil.cpu_count(logical=True)}\n\n"
+        parts.append(f"Processor: {cpu_name}\n")
+        parts.append(f"Architecture: {_MACHINE}\n")
+        parts.append(f"Physical Cores: {_PHYS_CORES}\n")
+        parts.append(f"Total Cores: {_LOG_CORES}\n\n")
         
-        cpu_freq = psutil.cpu_freq()
+        cpu_freq = snap.cpu_freq
         if cpu_freq:
-            info += f"Max Frequency: {cpu_freq.max:.2f} MHz\n"
-            info += f"Min Frequency: {cpu_freq.min:.2f} MHz\n"
-            info += f"Current Frequency: {cpu_freq.current:.2f} MHz\n\n"
+            parts.append(f"Max Frequency: {cpu_freq.max:.2f} MHz\n")
+            parts.append(f"Min Frequency: {cpu_freq.min:.2f} MHz\n")
+            parts.append(f"Current Frequency: {cpu_freq.current:.2f} MHz\n\n")
         
-        info += "CPU Usage Per Core:\n"
-        for i, percentage in enumerate(psutil.cpu_percent(percpu=True, interval=1)):
-            info += f"  Core {i}: {percentage}%\n"
+        # Usage since the previous call (app start or the last scan)
+        parts.append("CPU Usage Per Core:\n")
+        for i, percentage in enumerate(psutil.cpu_percent(percpu=True, interval=None)):
+            parts.append(f"  Core {i}: {percentage}%\n")
         
-        info += f"\nTotal CPU Usage: {psutil.cpu_percent()}%\n"
+        parts.append(f"\nTotal CPU Usage: {psutil.cpu_percent()}%\n")
         
-        return info
+        return "".join(parts)
     
-    def get_memory_info(self):
+    def get_memory_info(self, snap):
         """Get memory information"""
-        info = "MEMORY INFORMATION\n"
-        info += "="*50 + "\n\n"
+        parts = [f"MEMORY INFORMATION\n{_EQ}\n\n"]
         
-        svmem = psutil.virtual_memory()
-        info += f"Total RAM: {get_size(svmem.total)}\n"
-        info += f"Available: {get_size(svmem.available)}\n"
-        info += f"Used: {get_size(svmem.used)} ({svmem.percent}%)\n"
-        info += f"Free: {get_size(svmem.free)}\n"
+        svmem = snap.vmem
+        parts.append(f"Total RAM: {get_size(svmem.total)}\n")
+        parts.append(f"Available: {get_size(svmem.available)}\n")
+        parts.append(f"Used: {get_size(svmem.used)} ({svmem.percent}%)\n")
+        parts.append(f"Free: {get_size(svmem.free)}\n")
         
         # Get detailed RAM info on Windows
-        if platform.system() == "Windows":
-            info += "\n" + "="*50 + "\n"
-            info += "RAM MODULES:\n"
-            info += "="*50 + "\n\n"
+        if _IS_WIN:
+            parts.append(_section("RAM MODULES:"))
             
             try:
-                # Use PowerShell for better compatibility
-                ps_command = 'Get-CimInstance Win32_PhysicalMemory | Select-Object Manufacturer, PartNumber, Capacity, Speed, DeviceLocator | ConvertTo-Json'
-                result = subprocess.run(
-                    ['powershell', '-Command', ps_command],
-                    capture_output=True, text=True, timeout=10
-                )
+                # Use the prefetched WMI batch for better compatibility
+                ram_data = self._wmi_records('ram')
                 
-                if result.returncode == 0 and result.stdout.strip():
-                    import json
-                    try:
-                        ram_data = json.loads(result.stdout)
+                if ram_data is not None:
+                    for i, module in enumerate(ram_data, 1):
+                        parts.append(f"Module {i}:\n")
                         
-                        # Handle single module (not a list)
-                        if isinstance(ram_data, dict):
-                            ram_data = [ram_data]
+                        capacity = module.get('Capacity')
+                        if capacity:
+                            parts.append(f"  Capacity: {get_size(int(capacity))}\n")
                         
-                        for i, module in enumerate(ram_data, 1):
-                            info += f"Module {i}:\n"
-                            
-                            capacity = module.get('Capacity')
-                            if capacity:
-                                info += f"  Capacity: {get_size(int(capacity))}\n"
-                            
-                            manufacturer = module.get('Manufacturer', '').strip()
-                            if manufacturer:
-                                info += f"  Manufacturer: {manufacturer}\n"
-                            
-                            part_number = module.get('PartNumber', '').strip()
-                            if part_number:
-                                info += f"  Part Number: {part_number}\n"
-                            
-                            speed = module.get('Speed')
-                            if speed:
-                                info += f"  Speed: {speed} MHz\n"
-                            
-                            device_locator = module.get('DeviceLocator', '').strip()
-                            if device_locator:
-                                info += f"  Slot: {device_locator}\n"
-                            
-                            info += "\n"
-                    except json.JSONDecodeError:
-                        info += "Could not parse RAM module information\n\n"
-                else:
-                    # Fallback to WMIC if PowerShell fails
-                    try:
-                        result = subprocess.run(
-                            ['wmic', 'memorychip', 'get', 'capacity,speed,manufacturer,partnumber,devicelocator'],
-                            capture_output=True, text=True, timeout=5, 
-                            creationflags=subprocess.CREATE_NO_WINDOW
-                        )
+                        manufacturer = (module.get('Manufacturer') or '').strip()
+                        if manufacturer:
+                            parts.append(f"  Manufacturer: {manufacturer}\n")
+                        
+                        part_number = (module.get('PartNumber') or '').strip()
+                        if part_number:
+                            parts.append(f"  Part Number: {part_number}\n")
                         
-                        if result.returncode == 0 and result.stdout.strip():
-                            lines = result.stdout.strip().split('\n')
-                            if len(lines) > 1:
-                                # Parse header
-                                header_line = lines[0]
-                                
-                                module_num = 1
-                                for line in lines[1:]:
-                                    line = line.strip()
-                                    if line:
-                                        parts = line.split()
-                                        if len(parts) >= 2 and parts[0].isdigit():
-                                            capacity = int(parts[0])
-                                            if capacity > 0:
-                                                info += f"Module {module_num}:\n"
-                                                info += f"  Capacity: {get_size(capacity)}\n"
-                                                
-                                                if len(parts) >= 2:
-                                                    info += f"  Speed: {parts[1]} MHz\n"
-                                                if len(parts) >= 3:
-                                                    info += f"  Manufacturer: {parts[2]}\n"
-                                                if len(parts) >= 4:
-                                                    info += f"  Part Number: {' '.join(parts[3:])}\n"
-                                                
-                                                info += "\n"
-                                                module_num += 1
-                        else:
-                            info += "RAM module details unavailable\n\n"
-                    except Exception as e:
-                        info += f"RAM module details unavailable: {str(e)}\n\n"
+                        speed = module.get('Speed')
+                        if speed:
+                            parts.append(f"  Speed: {speed} MHz\n")
+                        
+                        device_locator = (module.get('DeviceLocator') or '').strip()
+                        if device_locator:
+                            parts.append(f"  Slot: {device_locator}\n")
+                        
+                        parts.append("\n")
+                else:
+                    parts.append("RAM module details unavailable\n\n")
                         
             except Exception as e:
-                info += f"Detailed RAM info unavailable: {str(e)}\n\n"
+                parts.append(f"Detailed RAM info unavailable: {str(e)}\n\n")
         
-        swap = psutil.swap_memory()
-        info += "\nSwap Memory:\n"
-        info += f"  Total: {get_size(swap.total)}\n"
-        info += f"  Used: {get_size(swap.used)} ({swap.percent}%)\n"
-        info += f"  Free: {get_size(swap.free)}\n"
+        swap = snap.swap
+        parts.append("\nSwap Memory:\n")
+        parts.append(f"  Total: {get_size(swap.total)}\n")
+        parts.append(f"  Used: {get_size(swap.used)} ({swap.percent}%)\n")
+        parts.append(f"  Free: {get_size(swap.free)}\n")
         
-        return info
+        return "".join(parts)
     
-    def get_gpu_info(self):
+    def get_gpu_info(self, snap):
         """Get GPU information"""
-        info = "GPU INFORMATION\n"
-        info += "="*50 + "\n\n"
+        parts = [f"GPU INFORMATION\n{_EQ}\n\n"]
         
         gpu_found = False
         
-        # Try nvidia-smi
-        try:
-            result = subprocess.run(
-                ['nvidia-smi', '--query-gpu=name,driver_version,temperature.gpu,memory.total,memory.used,memory.free,utilization.gpu',
-                 '--format=csv,noheader,nounits'],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                gpu_found = True
-                info += "NVIDIA GPU(s):\n\n"
-                for i, line in enumerate(result.stdout.strip().split('\n')):
-                    parts = [p.strip() for p in line.split(',')]
-                    if len(parts) >= 7:
-                        info += f"GPU {i}: {parts[0]}\n"
-                        info += f"  Driver Version: {parts[1]}\n"
-                        info += f"  Temperature: {parts[2]}°C\n"
-                        info += f"  Memory Total: {parts[3]} MB\n"
-                        info += f"  Memory Used: {parts[4]} MB\n"
-                        info += f"  Memory Free: {parts[5]} MB\n"
-                        info += f"  GPU Utilization: {parts[6]}%\n\n"
-        except:
-            pass
-        
-        # Windows WMIC
-        if platform.system() == "Windows":
-            try:
-                result = subprocess.run(
-                    ['wmic', 'path', 'win32_videocontroller', 'get', 
-                     'name,driverversion,adapterram', '/format:list'],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    if not gpu_found:
-                        info += "Detected GPU(s):\n\n"
-                    
-                    current_gpu = {}
-                    for line in result.stdout.split('\n'):
-                        line = line.strip()
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            if value:
-                                current_gpu[key] = value
-                        elif current_gpu and 'Name' in current_gpu:
-                            info += f"{current_gpu.get('Name', 'Unknown')}\n"
-                            if 'DriverVersion' in current_gpu:
-                                info += f"  Driver: {current_gpu['DriverVersion']}\n"
-                            if 'AdapterRAM' in current_gpu:
-                                try:
-                                    ram = int(current_gpu['AdapterRAM'])
-                                    info += f"  Memory: {get_size(ram)}\n"
-                                except:
-                                    pass
-                            info += "\n"
-                            current_gpu = {}
-                            gpu_found = True
-            except:
-                pass
+        # Try NVML, then nvidia-smi if the NVML library isn't available
+        nvidia_gpus = self._get_nvidia_gpus()
+        if nvidia_gpus:
+            gpu_found = True
+            parts.append("NVIDIA GPU(s):\n\n")
+            for i, fields in enumerate(nvidia_gpus):
+                if len(fields) >= 7:
+                    parts.append(f"GPU {i}: {fields[0]}\n")
+                    parts.append(f"  Driver Version: {fields[1]}\n")
+                    parts.append(f"  Temperature: {fields[2]}°C\n")
+                    parts.append(f"  Memory Total: {fields[3]} MB\n")
+                    parts.append(f"  Memory Used: {fields[4]} MB\n")
+                    parts.append(f"  Memory Free: {fields[5]} MB\n")
+                    parts.append(f"  GPU Utilization: {fields[6]}%\n\n")
+        
+        # Windows registry / WMI
+        if _IS_WIN:
+            gpu_data = self._read_gpu_records()
+            
+            if gpu_data:
+                if not gpu_found:
+                    parts.append("Detected GPU(s):\n\n")
+                
+                for gpu in gpu_data:
+                    parts.append(f"{(gpu.get('Name') or 'Unknown').strip()}\n")
+                    if gpu.get('DriverVersion'):
+                        parts.append(f"  Driver: {gpu['DriverVersion']}\n")
+                    if gpu.get('AdapterRAM'):
+                        try:
+                            parts.append(f"  Memory: {get_size(int(gpu['AdapterRAM']))}\n")
+                        except ValueError:
+                            pass
+                    parts.append("\n")
+                    gpu_found = True
         
         if not gpu_found:
-            info += "No GPU information available\n"
+            parts.append("No GPU information available\n")
         
-        return info
+        return "".join(parts)
     
-    def get_disk_info(self):
+    def get_disk_info(self, snap):
         """Get storage information"""
-        info = "STORAGE INFORMATION\n"
-        info += "="*50 + "\n\n"
-        
-        partitions = psutil.disk_partitions()
-        for partition in partitions:
-            info += f"Device: {partition.device}\n"
-            info += f"  Mountpoint: {partition.mountpoint}\n"
-            info += f"  File System: {partition.fstype}\n"
+        parts = [f"STORAGE INFORMATION\n{_EQ}\n\n"]
+        
+        for partition, usage in snap.usages.result():
+            parts.append(f"Device: {partition.device}\n")
+            parts.append(f"  Mountpoint: {partition.mountpoint}\n")
+            parts.append(f"  File System: {partition.fstype}\n")
             
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                info += f"  Total: {get_size(usage.total)}\n"
-                info += f"  Used: {get_size(usage.used)} ({usage.percent}%)\n"
-                info += f"  Free: {get_size(usage.free)}\n"
-            except:
-                info += "  (Permission denied)\n"
-            info += "\n"
-        
-        disk_io = psutil.disk_io_counters()
+            if usage:
+                parts.append(f"  Total: {get_size(usage.total)}\n")
+                parts.append(f"  Used: {get_size(usage.used)} ({usage.percent}%)\n")
+                parts.append(f"  Free: {get_size(usage.free)}\n")
+            else:
+                parts.append("  (Permission denied or not responding)\n")
+            parts.append("\n")
+        
+        disk_io = snap.disk_io
         if disk_io:
-            info += "Total Disk I/O:\n"
-            info += f"  Read: {get_size(disk_io.read_bytes)}\n"
-            info += f"  Written: {get_size(disk_io.write_bytes)}\n\n"
+            parts.append("Total Disk I/O:\n")
+            parts.append(f"  Read: {get_size(disk_io.read_bytes)}\n")
+            parts.append(f"  Written: {get_size(disk_io.write_bytes)}\n\n")
         
         # Physical disks on Windows
-        if platform.system() == "Windows":
-            try:
-                result = subprocess.run(
-                    ['wmic', 'diskdrive', 'get', 'model,size,interfacetype', '/format:list'],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    info += "Physical Disks:\n"
-                    current_disk = {}
-                    for line in result.stdout.split('\n'):
-                        line = line.strip()
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            if value:
-                                current_disk[key] = value
-                        elif current_disk and 'Model' in current_disk:
-                            info += f"\n  {current_disk.get('Model', 'Unknown')}\n"
-                            if 'Size' in current_disk:
-                                try:
-                                    size = int(current_disk['Size'])
-                                    info += f"    Capacity: {get_size(size)}\n"
-                                except:
-                                    pass
-                            if 'InterfaceType' in current_disk:
-                                info += f"    Interface: {current_disk['InterfaceType']}\n"
-                            current_disk = {}
-            except:
-                pass
-        
-        return info
+        if _IS_WIN:
+            disk_data = self._wmi_records('disks')
+            
+            if disk_data is not None:
+                parts.append("Physical Disks:\n")
+                for disk in disk_data:
+                    parts.append(f"\n  {(disk.get('Model') or 'Unknown').strip()}\n")
+                    if disk.get('Size'):
+                        try:
+                            parts.append(f"    Capacity: {get_size(int(disk['Size']))}\n")
+                        except ValueError:
+                            pass
+                    if disk.get('InterfaceType'):
+                        parts.append(f"    Interface: {disk['InterfaceType']}\n")
+        
+        return "".join(parts)
     
-    def get_motherboard_info(self):
+    def get_motherboard_info(self, snap):
         """Get motherboard information"""
-        info = "MOTHERBOARD INFORMATION\n"
-        info += "="*50 + "\n\n"
+        parts = [f"MOTHERBOARD INFORMATION\n{_EQ}\n\n"]
         
-        if platform.system() == "Windows":
+        if _IS_WIN:
             try:
-                # Use PowerShell for motherboard info
-                ps_command = 'Get-CimInstance Win32_BaseBoard | Select-Object Manufacturer, Product, Version, SerialNumber | ConvertTo-Json'
-                result = subprocess.run(
-                    ['powershell', '-Command', ps_command],
-                    capture_output=True, text=True, timeout=10
-                )
+                # Registry first, prefetched WMI batch for the rest
+                mobo_data = self._get_board_data()
                 
-                if result.returncode == 0 and result.stdout.strip():
-                    import json
-                    try:
-                        mobo_data = json.loads(result.stdout)
-                        
-                        manufacturer = mobo_data.get('Manufacturer', '').strip()
-                        if manufacturer:
-                            info += f"Manufacturer: {manufacturer}\n"
-                        
-                        product = mobo_data.get('Product', '').strip()
-                        if product:
-                            info += f"Model: {product}\n"
-                        
-                        version = mobo_data.get('Version', '').strip()
-                        if version:
-                            info += f"Version: {version}\n"
-                        
-                        serial = mobo_data.get('SerialNumber', '').strip()
-                        if serial and serial != 'Default string':
-                            info += f"Serial Number: {serial}\n"
-                            
-                    except json.JSONDecodeError:
-                        info += "Could not parse motherboard information\n"
+                if any(mobo_data.values()):
+                    manufacturer = (mobo_data.get('Manufacturer') or '').strip()
+                    if manufacturer:
+                        parts.append(f"Manufacturer: {manufacturer}\n")
+                    
+                    product = (mobo_data.get('Product') or '').strip()
+                    if product:
+                        parts.append(f"Model: {product}\n")
+                    
+                    version = (mobo_data.get('Version') or '').strip()
+                    if version:
+                        parts.append(f"Version: {version}\n")
+                    
+                    serial = (mobo_data.get('SerialNumber') or '').strip()
+                    if serial and serial != 'Default string':
+                        parts.append(f"Serial Number: {serial}\n")
                 else:
-                    info += "Motherboard information unavailable\n"
+                    parts.append("Motherboard information unavailable\n")
                 
                 # Get BIOS info
-                info += "\n" + "-"*50 + "\n"
-                info += "BIOS Information:\n"
-                info += "-"*50 + "\n\n"
+                parts.append(_section("BIOS Information:", _DASH))
                 
-                ps_command = 'Get-CimInstance Win32_BIOS | Select-Object Manufacturer, Name, Version, ReleaseDate | ConvertTo-Json'
-                result = subprocess.run(
-                    ['powershell', '-Command', ps_command],
-                    capture_output=True, text=True, timeout=10
-                )
+                bios_data = self._wmi_records('bios')
                 
-                if result.returncode == 0 and result.stdout.strip():
-                    try:
-                        bios_data = json.loads(result.stdout)
-                        
-                        manufacturer = bios_data.get('Manufacturer', '').strip()
-                        if manufacturer:
-                            info += f"Manufacturer: {manufacturer}\n"
-                        
-                        name = bios_data.get('Name', '').strip()
-                        if name:
-                            info += f"Name: {name}\n"
-                        
-                        version = bios_data.get('Version', '').strip()
-                        if version:
-                            info += f"Version: {version}\n"
-                        
-                        release_date = bios_data.get('ReleaseDate', '').strip()
-                        if release_date:
-                            # Parse date
-                            try:
-                                from datetime import datetime
+                if bios_data:
+                    bios_data = bios_data[0]
+                    
+                    manufacturer = (bios_data.get('Manufacturer') or '').strip()
+                    if manufacturer:
+                        parts.append(f"Manufacturer: {manufacturer}\n")
+                    
+                    name = (bios_data.get('Name') or '').strip()
+                    if name:
+                        parts.append(f"Name: {name}\n")
+                    
+                    version = (bios_data.get('Version') or '').strip()
+                    if version:
+                        parts.append(f"Version: {version}\n")
+                    
+                    release_date = (bios_data.get('ReleaseDate') or '').strip()
+                    if release_date:
+                        # Parse date
+                        try:
+                            if release_date[:8].isdigit():
+                                # CIM_DATETIME from COM, e.g. 20200101000000.000000+000
+                                dt = datetime.strptime(release_date[:8], '%Y%m%d')
+                            else:
                                 dt = datetime.fromisoformat(release_date.replace('Z', '+00:00'))
-                                info += f"Release Date: {dt.strftime('%Y-%m-%d')}\n"
-                            except:
-                                info += f"Release Date: {release_date}\n"
-                                
-                    except json.JSONDecodeError:
-                        info += "Could not parse BIOS information\n"
+                            parts.append(f"Release Date: {dt.strftime('%Y-%m-%d')}\n")
+                        except ValueError:
+                            parts.append(f"Release Date: {release_date}\n")
                 else:
-                    info += "BIOS information unavailable\n"
+                    parts.append("BIOS information unavailable\n")
                         
             except Exception as e:
-                info += f"Unavailable: {str(e)}\n"
-        elif platform.system() == "Linux":
-            try:
-                with open('/sys/devices/virtual/dmi/id/board_vendor') as f:
-                    info += f"Manufacturer: {f.read().strip()}\n"
-                with open('/sys/devices/virtual/dmi/id/board_name') as f:
-                    info += f"Product: {f.read().strip()}\n"
-                with open('/sys/devices/virtual/dmi/id/board_version') as f:
-                    info += f"Version: {f.read().strip()}\n"
-            except:
-                info += "Unavailable (may need root)\n"
+                parts.append(f"Unavailable: {str(e)}\n")
+        elif _IS_LINUX:
+            board = get_dmi_board()
+            if board.get('board_vendor') or board.get('board_name'):
+                parts.append(f"Manufacturer: {board.get('board_vendor', '')}\n")
+                parts.append(f"Product: {board.get('board_name', '')}\n")
+                parts.append(f"Version: {board.get('board_version', '')}\n")
+            else:
+                parts.append("Unavailable (may need root)\n")
         else:
-            info += "Not available on this platform\n"
+            parts.append("Not available on this platform\n")
         
         # Temperature sensors
-        info += "\n" + "="*50 + "\n"
-        info += "TEMPERATURE SENSORS\n"
-        info += "="*50 + "\n\n"
+        parts.append(_section("TEMPERATURE SENSORS"))
         
         temp_found = False
         
-        # Try psutil first (works on Linux)
+        # Try the OS sensors first (hwmon on Linux, psutil elsewhere)
         try:
-            temps = psutil.sensors_temperatures()
+            temps = get_temperatures()
             if temps:
                 temp_found = True
                 for name, entries in temps.items():
-                    info += f"{name}:\n"
+                    parts.append(f"{name}:\n")
                     for entry in entries:
                         label = entry.label or 'Sensor'
-                        info += f"  {label}: {entry.current}°C"
+                        parts.append(f"  {label}: {entry.current}°C")
                         if entry.high:
-                            info += f" (High: {entry.high}°C)"
+                            parts.append(f" (High: {entry.high}°C)")
                         if entry.critical:
-                            info += f" (Critical: {entry.critical}°C)"
-                        info += "\n"
-                    info += "\n"
-        except:
+                            parts.append(f" (Critical: {entry.critical}°C)")
+                        parts.append("\n")
+                    parts.append("\n")
+        except (AttributeError, OSError):
             pass
         
-        # On Windows, try to get CPU temp via PowerShell WMI
-        if platform.system() == "Windows" and not temp_found:
+        # On Windows, try to get CPU temp from the WMI batch
+        if _IS_WIN and not temp_found and self._win_thermal_ok is not False:
             try:
                 # Try to get CPU temperature from WMI (works on some systems)
-                ps_command = 'Get-CimInstance -Namespace root/wmi -ClassName MSAcpi_ThermalZoneTemperature | Select-Object CurrentTemperature | ConvertTo-Json'
-                result = subprocess.run(
-                    ['powershell', '-Command', ps_command],
-                    capture_output=True, text=True, timeout=5
-                )
+                thermal_data = self._get_thermal_records()
                 
-                if result.returncode == 0 and result.stdout.strip() and 'CurrentTemperature' in result.stdout:
-                    import json
-                    try:
-                        temp_data = json.loads(result.stdout)
-                        if isinstance(temp_data, list):
-                            temp_data = temp_data[0] if temp_data else {}
-                        
-                        if 'CurrentTemperature' in temp_data:
-                            # Convert from tenths of Kelvin to Celsius
-                            temp_kelvin = temp_data['CurrentTemperature'] / 10
-                            temp_celsius = temp_kelvin - 273.15
-                            info += f"CPU Temperature: {temp_celsius:.1f}°C\n\n"
-                            temp_found = True
-                    except:
-                        pass
-            except:
+                if thermal_data and thermal_data[0].get('CurrentTemperature'):
+                    # Convert from tenths of Kelvin to Celsius
+                    temp_kelvin = thermal_data[0]['CurrentTemperature'] / 10
+                    temp_celsius = temp_kelvin - 273.15
+                    parts.append(f"CPU Temperature: {temp_celsius:.1f}°C\n\n")
+                    temp_found = True
+            except Exception:
                 pass
         
         if not temp_found:
-            info += "Temperature sensors not available.\n"
-            info += "\nNote: Windows does not expose temperature sensors through standard APIs.\n"
-            info += "For temperature monitoring on Windows, use:\n"
-            info += "  - HWMonitor (https://www.cpuid.com/softwares/hwmonitor.html)\n"
-            info += "  - Core Temp (https://www.alcpu.com/CoreTemp/)\n"
-            info += "  - Open Hardware Monitor (https://openhardwaremonitor.org/)\n\n"
+            parts.append("Temperature sensors not available.\n")
+            parts.append("\nNote: Windows does not expose temperature sensors through standard APIs.\n")
+            parts.append("For temperature monitoring on Windows, use:\n")
+            parts.append("  - HWMonitor (https://www.cpuid.com/softwares/hwmonitor.html)\n")
+            parts.append("  - Core Temp (https://www.alcpu.com/CoreTemp/)\n")
+            parts.append("  - Open Hardware Monitor (https://openhardwaremonitor.org/)\n\n")
         
         # Battery info
-        info += "\n" + "="*50 + "\n"
-        info += "POWER / BATTERY\n"
-        info += "="*50 + "\n\n"
+        parts.append(_section("POWER / BATTERY"))
         
         try:
-            battery = psutil.sensors_battery()
+            battery = get_battery()
             if battery:
-                info += f"Battery: {battery.percent}%\n"
-                info += f"Power Plugged: {'Yes' if battery.power_plugged else 'No'}\n"
+                parts.append(f"Battery: {battery.percent}%\n")
+                parts.append(f"Power Plugged: {'Yes' if battery.power_plugged else 'No'}\n")
                 if not battery.power_plugged:
                     secs = battery.secsleft
                     if secs not in [psutil.POWER_TIME_UNLIMITED, psutil.POWER_TIME_UNKNOWN]:
                         h = secs // 3600
                         m = (secs % 3600) // 60
-                        info += f"Time Remaining: {h}h {m}m\n"
+                        parts.append(f"Time Remaining: {h}h {m}m\n")
             else:
-                info += "No battery (desktop system)\n"
-        except:
-            info += "Battery info unavailable\n"
+                parts.append("No battery (desktop system)\n")
+        except Exception:
+            parts.append("Battery info unavailable\n")
         
-        return info
+        return "".join(parts)
     
-    def get_network_info(self):
+    def get_network_info(self, snap):
         """Get network information"""
-        info = "NETWORK INFORMATION\n"
-        info += "="*50 + "\n\n"
+        parts = [f"NETWORK INFORMATION\n{_EQ}\n\n"]
         
-        if_addrs = psutil.net_if_addrs()
+        if_addrs = snap.net_if_addrs
         for interface, addrs in if_addrs.items():
-            info += f"{interface}:\n"
+            parts.append(f"{interface}:\n")
             for addr in addrs:
-                try:
-                    if addr.family.name == 'AF_INET':
-                        info += f"  IPv4: {addr.address}\n"
-                        info += f"  Netmask: {addr.netmask}\n"
-                    elif addr.family.name == 'AF_INET6':
-                        info += f"  IPv6: {addr.address}\n"
-                except:
-                    pass
-            info += "\n"
-        
-        net_io = psutil.net_io_counters()
-        info += "Total Network I/O:\n"
-        info += f"  Sent: {get_size(net_io.bytes_sent)}\n"
-        info += f"  Received: {get_size(net_io.bytes_recv)}\n"
-        
-        return info
+                if addr.family == socket.AF_INET:
+                    parts.append(f"  IPv4: {addr.address}\n")
+                    parts.append(f"  Netmask: {addr.netmask}\n")
+                elif addr.family == socket.AF_INET6:
+                    parts.append(f"  IPv6: {addr.address}\n")
+            parts.append("\n")
+        
+        net_io = snap.net_io
+        parts.append("Total Network I/O:\n")
+        parts.append(f"  Sent: {get_size(net_io.bytes_sent)}\n")
+        parts.append(f"  Received: {get_size(net_io.bytes_recv)}\n")
+        
+        return "".join(parts)
     
-    def get_os_info(self):
+    def get_os_info(self, snap):
         """Get OS information"""
-        info = "OPERATING SYSTEM\n"
-        info += "="*50 + "\n\n"
+        parts = [f"OPERATING SYSTEM\n{_EQ}\n\n"]
         
-        uname = platform.uname()
-        info += f"System: {uname.system}\n"
-        info += f"Node Name: {uname.node}\n"
-        info += f"Release: {uname.release}\n"
-        info += f"Version: {uname.version}\n"
-        info += f"Machine: {uname.machine}\n"
-        info += f"Processor: {uname.processor}\n\n"
+        parts.append(get_os_details())
         
-        boot_time = psutil.boot_time()
-        boot_dt = datetime.fromtimestamp(boot_time)
-        info += f"Boot Time: {boot_dt.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        boot_dt = datetime.fromtimestamp(snap.boot_time)
+        parts.append(f"Boot Time: {boot_dt.strftime('%Y-%m-%d %H:%M:%S')}\n")
         
-        return info
+        return "".join(parts)
+    
+    def _write_text(self, f, text):
+        """Write text to a binary file as UTF-8 with the platform's line endings"""
+        f.write(text.replace('\n', os.linesep).encode('utf-8'))
     
     def export_to_text(self):
         """Export all information to a text file"""
         filename = f"system_info_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open(filename, 'wb', buffering=1 << 20) as f:
                 for tab_name, widget in self.text_widgets.items():
-                    f.write(f"\n{'='*60}\n")
-                    f.write(f"{tab_name.upper()}\n")
-                    f.write(f"{'='*60}\n\n")
-                    f.write(widget.get(1.0, tk.END))
-                    f.write("\n")
+                    self._write_text(f, _section(tab_name.upper(), _EQ_WIDE))
+                    # Copy the tab a slice of lines at a time instead of as one string
+                    last_line = int(widget.index(tk.END).split('.')[0])
+                    for start in range(1, last_line + 1, _EXPORT_CHUNK_LINES):
+                        self._write_text(f, widget.get(f"{start}.0", f"{start + _EXPORT_CHUNK_LINES}.0"))
+                    self._write_text(f, "\n")
             
             self.status_label.config(text=f"Exported to {filename}", 
                                    foreground="green")